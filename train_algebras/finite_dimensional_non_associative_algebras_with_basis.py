@@ -1,8 +1,162 @@
 from sage.misc.cachefunc import cached_method
 from sage.categories.category_types import Category_over_base_ring  # type: ignore
 from sage.categories.category_with_axiom import CategoryWithAxiom_over_base_ring  # type: ignore
+from sage.categories.magmas import Magmas  # type: ignore
 from sage.categories.magmatic_algebras import MagmaticAlgebras  # type: ignore
 from sage.matrix.constructor import matrix  # type: ignore
+from sage.matrix.special import identity_matrix  # type: ignore
+from copy import copy
+from sage.modules.free_module_element import vector  # type: ignore
+import itertools
+from sage.combinat.integer_vector import IntegerVectors  # type: ignore
+from sage.rings.integer_ring import ZZ  # type: ignore
+from sage.parallel.decorate import parallel  # type: ignore
+from sage.groups.matrix_gps.finitely_generated import MatrixGroup  # type: ignore
+from sage.rings.ideal import FieldIdeal  # type: ignore
+
+
+def _parallel_map(f, inputs, ncpus=1):
+    r"""
+    Return the list ``[f(x) for x in inputs]``, computed in parallel batches
+
+    INPUT:
+
+    - ``f`` -- a function of one argument
+    - ``inputs`` -- a list
+    - ``ncpus`` -- a positive integer or ``None`` (default: ``1``):
+      the number of processes to use; ``None`` uses all available
+      cpus; with ``1``, everything is computed serially in the
+      current process
+
+    The inputs are split into (at most) ``ncpus`` contiguous batches,
+    each of which is mapped serially by one worker process.
+
+    An error in a worker is raised as a :class:`RuntimeError`; Sage's
+    :func:`parallel` decorator would otherwise silently return
+    ``'NO DATA'`` for the failed batch.
+
+    EXAMPLES::
+
+        sage: from train_algebras.finite_dimensional_non_associative_algebras_with_basis import _parallel_map
+        sage: _parallel_map(lambda x: x^2, [1, 2, 3, 4, 5], ncpus=2)
+        [1, 4, 9, 16, 25]
+        sage: _parallel_map(lambda x: x^2, [1, 2, 3, 4])
+        [1, 4, 9, 16]
+        sage: _parallel_map(lambda x: x^2, [])
+        []
+
+    TESTS::
+
+        sage: _parallel_map(lambda x: 1/x, [1, 0], ncpus=2)
+        Traceback (most recent call last):
+        ...
+        RuntimeError: parallel computation failed on inputs 1 to 1
+        sage: _parallel_map(lambda x: 1/x, [1, 0])
+        Traceback (most recent call last):
+        ...
+        ZeroDivisionError: rational division by zero
+    """
+    if ncpus is None:
+        from sage.parallel.ncpus import ncpus as number_of_cpus  # type: ignore
+        ncpus = number_of_cpus()
+    ncpus = min(ncpus, len(inputs))
+    if ncpus <= 1:
+        return [f(x) for x in inputs]
+    # Boundaries of the batches: batch k is inputs[bounds[k]:bounds[k+1]]
+    bounds = [(k * len(inputs)) // ncpus for k in range(ncpus + 1)]
+
+    def map_batch(k):
+        return [f(x) for x in inputs[bounds[k]:bounds[k + 1]]]
+
+    # The parallel decorator returns the results in arbitrary order,
+    # each tagged by its arguments ((k,), {})
+    results = {}
+    for args, result in parallel(ncpus=ncpus)(map_batch)(list(range(ncpus))):
+        k = args[0][0]
+        size = bounds[k + 1] - bounds[k]
+        if not (isinstance(result, list) and len(result) == size):
+            raise RuntimeError("parallel computation failed on inputs %s to %s"
+                               % (bounds[k], bounds[k + 1] - 1))
+        results[k] = result
+    return [y for k in range(ncpus) for y in results[k]]
+
+
+def _lines(exponents, i):
+    r"""
+    Return the lines of ``exponents`` in the direction of the ``i``-th variable
+
+    INPUT:
+
+    - ``exponents`` -- a list of tuples of nonnegative integers
+    - ``i`` -- an integer
+
+    OUTPUT: the list of the maximal subsets of ``exponents`` whose
+    elements only differ in their ``i``-th entry, each sorted along
+    this entry. When ``exponents`` is a lower set, each line has
+    ``i``-th entries `0, 1, \ldots, L`.
+
+    EXAMPLES::
+
+        sage: from train_algebras.finite_dimensional_non_associative_algebras_with_basis import _lines
+        sage: _lines([(0, 0), (0, 1), (1, 0)], 0)
+        [[(0, 0), (1, 0)], [(0, 1)]]
+        sage: _lines([(0, 0), (0, 1), (1, 0)], 1)
+        [[(0, 0), (0, 1)], [(1, 0)]]
+    """
+    lines = {}
+    for alpha in exponents:
+        lines.setdefault(alpha[:i] + alpha[i + 1:], []).append(alpha)
+    return [sorted(line, key=lambda alpha: alpha[i]) for line in lines.values()]
+
+
+def _generating_subset(elements):
+    r"""
+    Return a small subset of ``elements`` generating the group they form
+
+    INPUT:
+
+    - ``elements`` -- a list of the elements of a finite group of
+      invertible matrices
+
+    Elements are picked greedily when they are not in the subgroup
+    generated by the previous ones; as each pick at least doubles the
+    order of this subgroup, at most `\log_2` of the group order
+    elements are returned.
+
+    EXAMPLES::
+
+        sage: from train_algebras.finite_dimensional_non_associative_algebras_with_basis import _generating_subset
+        sage: m = matrix(GF(7), [[3]])
+        sage: _generating_subset([m^k for k in range(6)])
+        [[3]]
+        sage: _generating_subset([identity_matrix(GF(7), 1)])
+        []
+    """
+    generators = []
+    generated = set()
+    for g in elements:
+        g = copy(g)
+        g.set_immutable()
+        if not generated:
+            identity = identity_matrix(g.base_ring(), g.nrows())
+            identity.set_immutable()
+            generated.add(identity)
+        if g in generated:
+            continue
+        generators.append(g)
+        # Close the subgroup under right multiplication by the generators
+        frontier = list(generated)
+        while frontier:
+            new = []
+            for h in frontier:
+                for s in generators:
+                    k = h * s
+                    k.set_immutable()
+                    if k not in generated:
+                        generated.add(k)
+                        new.append(k)
+            frontier = new
+    return generators
 
 
 class FiniteDimensionalNonAssociativeAlgebrasWithBasis(Category_over_base_ring):
@@ -44,26 +198,39 @@ class FiniteDimensionalNonAssociativeAlgebrasWithBasis(Category_over_base_ring):
             """
             return self.basis()
 
-        def isomorphism_ideal(self, other):
+        def isomorphism_equations(self, other):
             """
-            Computes the ideal whose variety is the set of isomorphisms from ``self`` to ``other``
+            Return the polynomial equations defining the isomorphisms from ``self`` to ``other``
+
+            INPUT:
+
+            - ``other`` -- an algebra
+
+            The equations live in a polynomial ring over the base ring
+            with an indeterminate ``xij`` for each coefficient of the
+            matrix of a generic linear morphism `w`, and an
+            indeterminate ``invdet`` for the inverse of its
+            determinant. They state that `w(i) w(j) - w(j i)` vanishes
+            for each pair `(i, j)` of basis elements of ``self``, and
+            that the determinant of `w` is invertible. The images of
+            the basis by `w` are computed once; when ``self`` is
+            commutative, only the pairs with `i` before `j` in the
+            basis are considered. Duplicate equations are removed.
+
+            This is the list of generators of :meth:`isomorphism_ideal`,
+            and may be fed to other solvers.
 
             EXAMPLES::
 
                 sage: import train_algebras
                 sage: A2 = train_algebras.examples.A2(QQ)
-                sage: A3 = train_algebras.examples.A3(QQ)
-                sage: A4 = train_algebras.examples.A4(QQ)
-                sage: A2.isomorphism_ideal(A2).dimension()
-                2
-                sage: A3.isomorphism_ideal(A3).dimension()
-                4
-                sage: A2.isomorphism_ideal(A3).dimension()
-                -1
-                sage: A2.isomorphism_ideal(A4).dimension()
-                -1
-                sage: A3.isomorphism_ideal(A4).dimension()
-                -1
+                sage: equations = A2.isomorphism_equations(A2)
+                sage: R = equations[0].parent(); R
+                Multivariate Polynomial Ring in xee, xev, xet, xve, xvv, xvt, xte, xtv, xtt, invdet over Rational Field
+                sage: len(equations) == len(set(equations))
+                True
+                sage: R.ideal(equations) == A2.isomorphism_ideal(A2)
+                True
             """
             # j: the index of an element of the basis of ``self``
             # i:  the index of an element of the basis of ``other``
@@ -81,20 +248,376 @@ class FiniteDimensionalNonAssociativeAlgebrasWithBasis(Category_over_base_ring):
                 return other.sum_of_terms([(i, indeterminates[i, j]) for i in I])
 
             w = self.module_morphism(generic_morphism_on_basis, codomain=other)
-            equations = [
-                c
-                for i in self.basis()
-                for j in self.basis()
-                for c in (w(i) * w(j) - w(j * i)).coefficients()
-            ]
+            basis = self.basis()
+            images = {j: w(basis[j]) for j in J}
+            keys = list(J)
+            if self in Magmas().Commutative():
+                pairs = [(i, j) for k, i in enumerate(keys) for j in keys[k:]]
+            else:
+                pairs = [(i, j) for i in keys for j in keys]
+            equations = []
+            seen = set()
+            for i, j in pairs:
+                defect = images[i] * images[j] - w(basis[j] * basis[i])
+                for c in defect.coefficients():
+                    if c not in seen:
+                        seen.add(c)
+                        equations.append(c)
             det = matrix(len(I), len(J), R.gens()[:-1]).determinant()
             equation_det_non_nul = det * invdet - 1
             equations.append(equation_det_non_nul)
-            return R.ideal(equations)
+            return equations
+
+        def isomorphism_ideal(self, other):
+            """
+            Computes the ideal whose variety is the set of isomorphisms from ``self`` to ``other``
+
+            See :meth:`isomorphism_equations` for its generators.
+
+            EXAMPLES::
+
+                sage: import train_algebras
+                sage: A2 = train_algebras.examples.A2(QQ)
+                sage: A3 = train_algebras.examples.A3(QQ)
+                sage: A4 = train_algebras.examples.A4(QQ)
+                sage: A2.isomorphism_ideal(A2).dimension()
+                2
+                sage: A3.isomorphism_ideal(A3).dimension()
+                4
+                sage: A2.isomorphism_ideal(A3).dimension()
+                -1
+                sage: A2.isomorphism_ideal(A4).dimension()
+                -1
+                sage: A3.isomorphism_ideal(A4).dimension()
+                -1
+            """
+            equations = self.isomorphism_equations(other)
+            return equations[-1].parent().ideal(equations)
+
+        def evaluation_interpolation(self, f, bound, ncpus=1):
+            r"""
+            Return ``f(self, R.gens())`` computed by evaluation and interpolation
+
+            INPUT:
+
+            - ``f`` -- a function taking as input an algebra ``A`` of
+              the same kind as ``self`` and a tuple ``p`` of elements
+              of the base ring of ``A``, and returning an element of ``A``
+            - ``bound`` -- an integer bounding the total degree of the
+              coefficients of the result, or a tuple of integers
+              bounding their degrees in each variable
+            - ``ncpus`` -- the number of processes to use (default:
+              ``1``); see :func:`_parallel_map`
+
+            The base ring of ``self`` should be a multivariate
+            polynomial ring `R=K[x_1,\ldots,x_m]` over a field `K`,
+            typically `\QQ` or a finite field. Instead of computing
+            directly with polynomial coefficients, ``f`` is evaluated
+            on the algebra ``A`` over `K`, using only arithmetic in
+            `K`, at the points ``p`` of `\NN^m` that are the exponents
+            of the monomials allowed by ``bound``; these evaluations
+            may be done in parallel. As these points form a lower set,
+            the coefficients of the result are reconstructed by Newton
+            divided differences along each variable in turn, without
+            solving any linear system.
+
+            The result is checked at one extra random point, and a
+            :class:`ValueError` is raised if ``bound`` is too small.
+            The characteristic of `K` should be zero or larger than
+            the degree bound in each variable.
+
+            EXAMPLES:
+
+            We compute the square of a generic element of the example
+            of train algebra::
+
+                sage: from train_algebras import TrainAlgebras
+                sage: R = QQ['x','y','z']
+                sage: A = TrainAlgebras(R).example()
+                sage: def f(A, p):
+                ....:     x, y, z = p
+                ....:     e, v, t = A.algebra_generators()
+                ....:     X = x*e + y*v + z*t
+                ....:     return X*X
+                sage: X2 = A.evaluation_interpolation(f, 2)
+                sage: X2 == f(A, R.gens())
+                True
+                sage: X2.coefficient('e')
+                x^2
+
+            The same over a finite field, with degree bounds for each
+            variable::
+
+                sage: R = GF(101)['x','y','z']
+                sage: A = TrainAlgebras(R).example()
+                sage: A.evaluation_interpolation(f, (2, 2, 1)) == f(A, R.gens())
+                True
+
+            We check the train identity of the example (see
+            :class:`~train_algebras.train_algebras.Example`)::
+
+                sage: def g(A, p):
+                ....:     x, y, z = p
+                ....:     e, v, t = A.algebra_generators()
+                ....:     X = x*e + y*v + z*t
+                ....:     return 3 * X*((X*X)*e) - 2 * X*(X*(X*e)) - ((X*X)*X)*e
+                sage: A.evaluation_interpolation(g, 3)
+                0
+
+            TESTS::
+
+                sage: A = TrainAlgebras(QQ['x','y','z']).example()
+                sage: A.evaluation_interpolation(f, 1)
+                Traceback (most recent call last):
+                ...
+                ValueError: the degree bound 1 is too small
+                sage: A.evaluation_interpolation(f, (2, 2))
+                Traceback (most recent call last):
+                ...
+                ValueError: the degree bound (2, 2) should have one entry per variable
+                sage: A = TrainAlgebras(GF(2)['x','y','z']).example()
+                sage: A.evaluation_interpolation(f, 2)
+                Traceback (most recent call last):
+                ...
+                ValueError: the degree bound 2 is not smaller than the characteristic 2
+                sage: R = GF(3)['x','y','z']
+                sage: A = TrainAlgebras(R).example()
+                sage: A.evaluation_interpolation(f, 2, ncpus=2) == f(A, R.gens())
+                True
+            """
+            R = self.base_ring()
+            K = R.base_ring()
+            n = R.ngens()
+            if bound in ZZ:
+                degree_bound = bound
+                exponents = [tuple(alpha) for d in range(bound + 1)
+                             for alpha in IntegerVectors(d, n)]
+            else:
+                if len(bound) != n:
+                    raise ValueError(
+                        "the degree bound %s should have one entry per variable"
+                        % (bound,)
+                    )
+                degree_bound = max(bound, default=0)
+                exponents = list(itertools.product(*(range(d + 1) for d in bound)))
+            characteristic = K.characteristic()
+            if characteristic and characteristic <= degree_bound:
+                raise ValueError(
+                    "the degree bound %s is not smaller than the characteristic %s"
+                    % (degree_bound, characteristic)
+                )
+
+            if K.is_finite():
+                check_point = tuple(K.random_element() for _ in range(n))
+            else:
+                check_point = tuple(K(ZZ.random_element(-2**20, 2**20))
+                                    for _ in range(n))
+            points = [tuple(K(a) for a in alpha) for alpha in exponents]
+            keys = list(self.basis().keys())
+            specialized = self.__class__(K)
+
+            def evaluate(point):
+                y = f(specialized, point)
+                return vector(K, [y[key] for key in keys])
+
+            values = _parallel_map(evaluate, points + [check_point], ncpus=ncpus)
+            check_value = values.pop()
+            coefficients = dict(zip(exponents, values))
+            # Newton divided differences on the nodes 0, 1, ..., L of each line
+            for i in range(n):
+                for line in _lines(exponents, i):
+                    c = [coefficients[alpha] for alpha in line]
+                    for k in range(1, len(c)):
+                        for j in range(len(c) - 1, k - 1, -1):
+                            c[j] = (c[j] - c[j - 1]) / k
+                    coefficients.update(zip(line, c))
+            # Conversion from the Newton basis to the monomial basis
+            for i in range(n):
+                for line in _lines(exponents, i):
+                    c = [coefficients[alpha] for alpha in line]
+                    for k in range(len(c) - 2, -1, -1):
+                        for j in range(k, len(c) - 1):
+                            c[j] = c[j] - k * c[j + 1]
+                    coefficients.update(zip(line, c))
+
+            result = self.sum_of_terms(
+                (key, R(dict(zip(exponents, column))))
+                for key, column in zip(keys, zip(*(coefficients[alpha]
+                                                   for alpha in exponents)))
+            )
+            if vector(K, [result[key](*check_point) for key in keys]) != check_value:
+                raise ValueError("the degree bound %s is too small" % (bound,))
+            return result
 
         def is_isomorphic(self, other):
             return self.isomorphism_ideal(other).dimension() >= 0
 
+        @cached_method
+        def derivations(self):
+            r"""
+            Return a basis of the derivations of ``self``
+
+            A derivation is a linear endomorphism `D` such that
+            `D(xy) = D(x)y + xD(y)` for all `x` and `y`. Derivations
+            are computed by linear algebra, as the solutions of these
+            equations for `x` and `y` in the basis.
+
+            OUTPUT: a tuple of matrices, the `j`-th column of each
+            matrix giving the image of the `j`-th basis element
+
+            Over a field of characteristic zero, the derivations form
+            the Lie algebra of the automorphism group, whose dimension
+            is therefore the number of derivations; this is a cheap
+            invariant, compared to :meth:`automorphism_ideal`.
+
+            EXAMPLES::
+
+                sage: import train_algebras
+                sage: A2 = train_algebras.examples.A2(QQ)
+                sage: A3 = train_algebras.examples.A3(QQ)
+                sage: len(A2.derivations())
+                2
+                sage: len(A3.derivations())
+                4
+                sage: e, v, t = A2.basis()
+                sage: x = 2*e + v + 3*t
+                sage: y = e - v + t
+                sage: all(D * (x*y).to_vector()
+                ....:     == ((A2.from_vector(D * x.to_vector()) * y)
+                ....:         + (x * A2.from_vector(D * y.to_vector()))).to_vector()
+                ....:     for D in A2.derivations())
+                True
+            """
+            keys = list(self.basis().keys())
+            n = len(keys)
+            products = {
+                (a, b): self.monomial(keys[a]) * self.monomial(keys[b])
+                for a in range(n)
+                for b in range(n)
+            }
+            # Unknown D[i, j] is at position i*n + j; there is one
+            # equation for each coefficient k of D(e_a e_b) - D(e_a) e_b - e_a D(e_b)
+            entries = {}
+
+            def add(row, column, coefficient):
+                entries[row, column] = entries.get((row, column), 0) + coefficient
+
+            for a in range(n):
+                for b in range(n):
+                    for k in range(n):
+                        row = (a * n + b) * n + k
+                        for l in range(n):
+                            add(row, k * n + l, products[a, b][keys[l]])
+                        for i in range(n):
+                            add(row, i * n + a, -products[i, b][keys[k]])
+                            add(row, i * n + b, -products[a, i][keys[k]])
+            equations = matrix(self.base_ring(), n ** 3, n ** 2, entries, sparse=True)
+            return tuple(
+                matrix(self.base_ring(), n, n, list(D))
+                for D in equations.right_kernel().basis()
+            )
+
+        @cached_method
+        def automorphism_ideal(self):
+            """
+            Return the ideal whose variety is the set of automorphisms of ``self``
+
+            See :meth:`isomorphism_ideal`.
+
+            The identity is always a point of this variety; over a field
+            of characteristic zero, its dimension is the number of
+            :meth:`derivations`.
+
+            EXAMPLES::
+
+                sage: import train_algebras
+                sage: A2 = train_algebras.examples.A2(QQ)
+                sage: I = A2.automorphism_ideal()
+                sage: I is A2.automorphism_ideal()
+                True
+                sage: I.dimension() == len(A2.derivations())
+                True
+            """
+            return self.isomorphism_ideal(self)
+
+        @cached_method
+        def automorphism_group(self):
+            """
+            Return the group of automorphisms of ``self`` with coefficients in its base ring
+
+            The dimension of the group is computed first. As the
+            identity is an automorphism, it is the dimension of the
+            tangent space at the identity, that is the number of
+            :meth:`derivations`, in characteristic zero; in positive
+            characteristic, where nonzero derivations may exist even
+            if the group is finite, it is computed from
+            :meth:`automorphism_ideal`.
+
+            If the dimension is `0`, the automorphisms are the points
+            of the variety of :meth:`automorphism_ideal`. If it is
+            positive and the base field is finite, the field equations
+            `x^q - x` are added to the ideal to get the finitely many
+            automorphisms with coefficients in the base field.
+            Otherwise, the group is infinite and this is not
+            implemented; in particular, in characteristic zero, only
+            finite automorphism groups are supported.
+
+            OUTPUT: a matrix group, the `j`-th column of each matrix
+            giving the image of the `j`-th basis element; its
+            generators are a small subset of the automorphisms (see
+            :func:`_generating_subset`)
+
+            EXAMPLES::
+
+                sage: import train_algebras
+                sage: A2 = train_algebras.examples.A2(GF(3))
+                sage: G = A2.automorphism_group()
+                sage: G.order()
+                6
+                sage: len(G.gens()) <= 2
+                True
+                sage: identity_matrix(GF(3), 3) in G
+                True
+                sage: e, v, t = A2.basis()
+                sage: x = e + 2*v
+                sage: def image(g, y):
+                ....:     return A2.from_vector(g.matrix() * y.to_vector())
+                sage: all(image(g, x*x) == image(g, x) * image(g, x) for g in G)
+                True
+                sage: G is A2.automorphism_group()
+                True
+
+            Over `\QQ`, the automorphism group of `A_2` is infinite::
+
+                sage: A2 = train_algebras.examples.A2(QQ)
+                sage: A2.automorphism_group()
+                Traceback (most recent call last):
+                ...
+                NotImplementedError: the automorphism group has positive dimension 2;
+                see derivations() and automorphism_ideal()
+            """
+            base_ring = self.base_ring()
+            I = self.automorphism_ideal()
+            if base_ring.characteristic() == 0:
+                dimension = len(self.derivations())
+            else:
+                dimension = I.dimension()
+            if dimension:
+                if not base_ring.is_finite():
+                    raise NotImplementedError(
+                        "the automorphism group has positive dimension %s;\n"
+                        "see derivations() and automorphism_ideal()" % dimension
+                    )
+                I = I + FieldIdeal(I.ring())
+            indeterminates = I.ring().gens()[:-1]
+            n = self.dimension()
+            automorphisms = [
+                matrix(base_ring, n, n, [point[x] for x in indeterminates])
+                for point in I.variety()
+            ]
+            generators = _generating_subset(automorphisms)
+            return MatrixGroup(generators or [identity_matrix(base_ring, n)])
+
     class Commutative(CategoryWithAxiom_over_base_ring):
 
         class ParentMethods:
@@ -126,12 +649,103 @@ class FiniteDimensionalNonAssociativeAlgebrasWithBasis(Category_over_base_ring):
                     sage: e*v
                     A['v']
                 """
-                t = self.product_on_basis_table
-                if (a, b) in t:
-                    return t[a, b]
-                elif (b, a) in t:
-                    return t[b, a]
-                raise TypeError("Product of %s and %s not defined" % (a, b))
+                for c, terms in self.sparse_structure_coefficients().get(a, ()):
+                    if c == b:
+                        return self._from_dict(dict(terms), remove_zeros=False)
+                return self.zero()
+
+            @cached_method
+            def sparse_structure_coefficients(self):
+                r"""
+                Return the nonzero structure coefficients of ``self``
+
+                OUTPUT: a dictionary mapping each basis index `a` to
+                the tuple of pairs `(b, terms)` such that the product
+                `e_a e_b` is nonzero, where ``terms`` is the tuple of
+                pairs `(c, \lambda)` such that `e_a e_b = \sum \lambda
+                e_c`, with `\lambda` nonzero.
+
+                Pairs with zero product are omitted, so that the memory
+                used scales with the number of nonzero structure
+                coefficients rather than with `n^3`. By commutativity,
+                the tuple ``terms`` of `e_a e_b` is built once and
+                shared between the rows of `a` and `b`.
+
+                EXAMPLES::
+
+                    sage: from train_algebras import FiniteDimensionalNonAssociativeAlgebrasWithBasis
+                    sage: A = FiniteDimensionalNonAssociativeAlgebrasWithBasis(QQ).example()
+                    sage: c = A.sparse_structure_coefficients()
+                    sage: sorted(b for b, terms in c['t'])
+                    ['e', 'v']
+                    sage: dict(c['t'])['e']
+                    (('t', 1/2),)
+                    sage: dict(c['t'])['e'] is dict(c['e'])['t']
+                    True
+                    sage: sorted(dict(c['e'])['e'])
+                    [('e', 1), ('t', 1)]
+
+                TESTS::
+
+                    sage: from train_algebras.train_algebras import Example
+                    sage: class Incomplete(Example):
+                    ....:     product_on_basis_table = {("e", "e"): 0}
+                    sage: Incomplete(QQ).sparse_structure_coefficients()
+                    Traceback (most recent call last):
+                    ...
+                    TypeError: Product of e and v not defined
+                """
+                keys = list(self.basis().keys())
+                table = self.product_on_basis_table
+                rows = {a: {} for a in keys}
+                for i, a in enumerate(keys):
+                    for b in keys[i:]:
+                        if (a, b) in table:
+                            product = table[a, b]
+                        elif (b, a) in table:
+                            product = table[b, a]
+                        else:
+                            raise TypeError("Product of %s and %s not defined" % (a, b))
+                        terms = tuple(self(product))
+                        if terms:
+                            rows[a][b] = terms
+                            rows[b][a] = terms
+                return {a: tuple(row.items()) for a, row in rows.items() if row}
+
+            def product(self, x, y):
+                r"""
+                Return the product of ``x`` and ``y``
+
+                This uses :meth:`sparse_structure_coefficients`: each
+                basis index in the support of ``x`` only visits the
+                basis indices with which its product is nonzero.
+
+                EXAMPLES::
+
+                    sage: from train_algebras import FiniteDimensionalNonAssociativeAlgebrasWithBasis
+                    sage: A = FiniteDimensionalNonAssociativeAlgebrasWithBasis(QQ).example()
+                    sage: e, v, t = A.algebra_generators()
+                    sage: A.product(e + v, t)
+                    A['t']
+                    sage: (e + 2*v) * (e + 3*t)
+                    A['e'] + 11/2*A['t'] + 2*A['v']
+                    sage: (e + 3*t) * (e + 2*v)
+                    A['e'] + 11/2*A['t'] + 2*A['v']
+                    sage: t * t
+                    0
+                """
+                structure_coefficients = self.sparse_structure_coefficients()
+                y_coefficients = y.monomial_coefficients(copy=False)
+                result = {}
+                for a, x_a in x:
+                    for b, terms in structure_coefficients.get(a, ()):
+                        y_b = y_coefficients.get(b)
+                        if y_b is None:
+                            continue
+                        x_a_y_b = x_a * y_b
+                        for c, coefficient in terms:
+                            result[c] = result.get(c, 0) + x_a_y_b * coefficient
+                return self._from_dict(result, remove_zeros=True)
 
     class ElementMethods:
         def plenary_power(self, n):